@@ -1,14 +1,25 @@
 import os
+import hashlib
+import threading
+import time
 import numpy as np
+from functools import lru_cache
+from types import SimpleNamespace
 from flask import Flask, request, jsonify
 from dotenv import load_dotenv
-from langchain_openai import AzureChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
 from flask_cors import CORS
-from openai import AzureOpenAI
  
 load_dotenv()
  
+# Set AVATAR_BENCHMARK_MODE=1 to swap the Azure clients for deterministic
+# local stand-ins (see benchmark.py). No network calls are made in this mode.
+BENCHMARK_MODE = os.getenv("AVATAR_BENCHMARK_MODE") == "1"
+ 
+# Clients and the document index are built on first use. Unless
+# AVATAR_WARMUP=0, they are also built in a background thread at startup so
+# the first request doesn't pay for it while the server is already accepting.
+WARMUP_ON_STARTUP = os.getenv("AVATAR_WARMUP", "1") != "0"
+ 
 # -------------------------------
 # MICROSOFT BUDDY / UBTI SYSTEM PROMPT
 # -------------------------------
@@ -58,29 +69,74 @@ REMEMBER:
 You are UBTI’s Microsoft technology consultant. Your answers must always stay within Microsoft’s ecosystem and grounded in real capabilities.
 """
  
+# -------------------------------
+# OFFLINE STUBS (BENCHMARK MODE)
+# -------------------------------
+EMBEDDING_DIM = 1536
+ 
+class StubEmbeddingClient:
+    """Deterministic stand-in for AzureOpenAI embeddings with simulated latency."""
+ 
+    def __init__(self, latency_ms=0.0, dim=EMBEDDING_DIM):
+        self.latency_ms = latency_ms
+        self.dim = dim
+        self.embeddings = self
+ 
+    def create(self, input, model=None):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        data = []
+        for text in input:
+            seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "little")
+            vec = np.random.default_rng(seed).standard_normal(self.dim)
+            data.append(SimpleNamespace(embedding=vec.tolist()))
+        return SimpleNamespace(data=data)
+ 
+class StubChatModel:
+    """Stand-in for AzureChatOpenAI that answers after a fixed delay."""
+ 
+    def __init__(self, latency_ms=0.0):
+        self.latency_ms = latency_ms
+ 
+    def invoke(self, messages):
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000.0)
+        question = messages[-1].content if messages else ""
+        return SimpleNamespace(content=f"Stub answer to: {question[:80]}")
+ 
 # -------------------------------
 # LLM SETUP
 # -------------------------------
-llm = AzureChatOpenAI(
-    azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
-    api_version=os.getenv("AZURE_OPENAI_VERSION"),
-    azure_deployment=os.getenv("AZURE_DEPLOYMENT_NAME"),
-    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-    temperature=0.7,
-    max_tokens=150
-)
+@lru_cache(maxsize=None)
+def get_llm():
+    if BENCHMARK_MODE:
+        return StubChatModel(latency_ms=float(os.getenv("AVATAR_STUB_LLM_LATENCY_MS", "0")))
+    from langchain_openai import AzureChatOpenAI
+    return AzureChatOpenAI(
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        api_version=os.getenv("AZURE_OPENAI_VERSION"),
+        azure_deployment=os.getenv("AZURE_DEPLOYMENT_NAME"),
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        temperature=0.7,
+        max_tokens=150
+    )
  
 # -------------------------------
 # EMBEDDING CLIENT
 # -------------------------------
-embedding_client = AzureOpenAI(
-    api_key=os.getenv("AZURE_OPENAI_API_KEY"),
-    base_url="https://voiceagentdemo-resource.openai.azure.com/openai/",
-    api_version="2023-05-15"
-)
+@lru_cache(maxsize=None)
+def get_embedding_client():
+    if BENCHMARK_MODE:
+        return StubEmbeddingClient(latency_ms=float(os.getenv("AVATAR_STUB_EMBED_LATENCY_MS", "0")))
+    from openai import AzureOpenAI
+    return AzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        base_url="https://voiceagentdemo-resource.openai.azure.com/openai/",
+        api_version="2023-05-15"
+    )
  
 def get_embedding(text, model="text-embedding-ada-002"):
-    return embedding_client.embeddings.create(
+    return get_embedding_client().embeddings.create(
         input=[text],
         model=model
     ).data[0].embedding
@@ -96,37 +152,77 @@ DOC_FILES = [
  
 documents = []
 document_embeddings = []
+_documents_indexed = False
+_index_lock = threading.RLock()
  
-for filepath in DOC_FILES:
-    if os.path.exists(filepath):
-        with open(filepath, "r", encoding="utf-8") as f:
-            text = f.read().strip()
-        if text:
-            emb = get_embedding(text)
-            documents.append(text)
-            document_embeddings.append(np.array(emb))
-            print(f"Loaded + embedded file: {filepath}")
-        else:
-            print(f"File {filepath} is empty: {filepath}")
-    else:
-        print(f"File not found: {filepath}")
+def index_documents(texts):
+    """Embed ``texts`` and replace the in-memory RAG corpus with them."""
+    global documents, document_embeddings, _documents_indexed
+    texts = list(texts)
+    # Fill a preallocated array so the raw float lists never pile up in memory
+    embeddings = np.empty((0, 0))
+    for i, text in enumerate(texts):
+        emb = np.asarray(get_embedding(text))
+        if i == 0:
+            embeddings = np.empty((len(texts), emb.shape[0]), dtype=emb.dtype)
+        embeddings[i] = emb
+    with _index_lock:
+        documents, document_embeddings = texts, embeddings
+        _documents_indexed = True
  
-document_embeddings = np.array(document_embeddings)
+def ensure_documents_indexed():
+    if _documents_indexed:
+        return
+    with _index_lock:
+        if not _documents_indexed:
+            index_documents(load_document_files(DOC_FILES))
+ 
+def load_document_files(filepaths):
+    texts = []
+    for filepath in filepaths:
+        if os.path.exists(filepath):
+            with open(filepath, "r", encoding="utf-8") as f:
+                text = f.read().strip()
+            if text:
+                texts.append(text)
+                print(f"Loaded file: {filepath}")
+            else:
+                print(f"File {filepath} is empty: {filepath}")
+        else:
+            print(f"File not found: {filepath}")
+    return texts
  
 # -------------------------------
 # COSINE SIMILARITY RAG
 # -------------------------------
 def retrieve_relevant_context(query, top_k=2):
-    if not documents:
+    ensure_documents_indexed()
+    with _index_lock:
+        docs, doc_embeddings = documents, document_embeddings
+    if not docs:
         return ""
     query_emb = np.array(get_embedding(query))
-    scores = np.dot(document_embeddings, query_emb) / (
-        np.linalg.norm(document_embeddings, axis=1) * np.linalg.norm(query_emb)
+    scores = np.dot(doc_embeddings, query_emb) / (
+        np.linalg.norm(doc_embeddings, axis=1) * np.linalg.norm(query_emb)
     )
     top_indices = scores.argsort()[-top_k:][::-1]
-    context = "\n\n".join([documents[i] for i in top_indices])
+    context = "\n\n".join([docs[i] for i in top_indices])
     return context
  
+# -------------------------------
+# STARTUP WARMUP
+# -------------------------------
+def warmup():
+    try:
+        from langchain_core.messages import HumanMessage, SystemMessage  # noqa: F401
+        get_llm()
+        get_embedding_client()
+        if not BENCHMARK_MODE:
+            ensure_documents_indexed()
+        print("Warmup complete.")
+    except Exception as e:
+        print(f"Warmup error: {e}")
+ 
 # -------------------------------
 # FLASK APP
 # -------------------------------
@@ -144,6 +240,7 @@ def ask():
     if not question:
         return jsonify({"error": "Missing 'question' field"}), 400
     try:
+        from langchain_core.messages import HumanMessage, SystemMessage
         # Retrieve top relevant content from the UBTI project docs
         context = retrieve_relevant_context(question)
         rag_prompt = f"Relevant UBTI project knowledge:\n{context}\n\nUse this information ONLY if helpful.\n"
@@ -152,11 +249,14 @@ def ask():
             SystemMessage(content=SYSTEM_PROMPT + "\n\n" + rag_prompt),
             HumanMessage(content=question)
         ]
-        response = llm.invoke(messages)
+        response = get_llm().invoke(messages)
         return jsonify({"response": response.content})
     except Exception as e:
         print(f"Error: {e}")
         return jsonify({"error": "Sorry, I encountered an error processing your request. Please try again."}), 500
  
+if WARMUP_ON_STARTUP:
+    threading.Thread(target=warmup, name="avatar-warmup", daemon=True).start()
+ 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=8000)
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Offline load test for the Microsoft Buddy /ask pipeline.
+
+Runs avatar.py in benchmark mode (stub embedding client and LLM, no network),
+indexes a synthetic corpus at several sizes and reports retrieval time versus
+corpus size, end-to-end /ask latency under concurrent load, and memory.
+
+Usage:
+    python benchmark.py --sizes 3,100,1000,10000 --requests 200 --concurrency 8 \
+        --embed-latency-ms 20 --llm-latency-ms 300
+"""
+import argparse
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+TOPICS = [
+    "Azure Landing Zone", "Power Automate", "Copilot Studio", "Microsoft Fabric",
+    "Defender for Cloud", "Sentinel", "Dynamics 365", "Entra ID", "Power BI",
+    "Azure OpenAI", "SharePoint", "Teams Phone", "Purview", "Synapse", "GitHub Actions",
+]
+
+QUESTIONS = [
+    "How would you automate invoice approvals?",
+    "What does a secure Azure landing zone look like?",
+    "Can Copilot Studio answer questions from our SharePoint?",
+    "Which tool should we use for reporting on sales data?",
+    "How do we monitor threats across our tenant?",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="3,100,1000,10000",
+                        help="comma-separated corpus sizes to benchmark")
+    parser.add_argument("--requests", type=int, default=100,
+                        help="number of /ask requests per corpus size")
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="number of concurrent /ask workers")
+    parser.add_argument("--retrieval-iterations", type=int, default=50,
+                        help="retrieve_relevant_context calls timed per corpus size")
+    parser.add_argument("--embed-latency-ms", type=float, default=0.0,
+                        help="simulated latency of each embedding call")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0,
+                        help="simulated latency of each LLM call")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args()
+
+
+def synthetic_corpus(size, seed=0):
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(size):
+        topics = rng.sample(TOPICS, 3)
+        corpus.append(
+            f"UBTI project {i}: delivered {topics[0]} with {topics[1]} integration "
+            f"for a client in sector {rng.randint(1, 40)}, followed by {topics[2]} rollout "
+            f"over {rng.randint(2, 26)} weeks."
+        )
+    return corpus
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def time_retrieval(avatar, iterations):
+    timings = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        avatar.retrieve_relevant_context(QUESTIONS[i % len(QUESTIONS)])
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def run_load(avatar, total, concurrency):
+    def worker(indices):
+        client = avatar.app.test_client()
+        results = []
+        for i in indices:
+            start = time.perf_counter()
+            resp = client.post("/ask", json={"question": QUESTIONS[i % len(QUESTIONS)]})
+            results.append(((time.perf_counter() - start) * 1000, resp.status_code))
+        return results
+
+    batches = [range(w, total, concurrency) for w in range(concurrency)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = [r for batch in pool.map(worker, batches) for r in batch]
+    elapsed = time.perf_counter() - start
+    latencies = [latency for latency, _ in results]
+    errors = sum(1 for _, status in results if status != 200)
+    return latencies, errors, elapsed
+
+
+def main():
+    args = parse_args()
+    os.environ["AVATAR_BENCHMARK_MODE"] = "1"
+    os.environ["AVATAR_WARMUP"] = "0"
+    os.environ["AVATAR_STUB_EMBED_LATENCY_MS"] = str(args.embed_latency_ms)
+    os.environ["AVATAR_STUB_LLM_LATENCY_MS"] = str(args.llm_latency_ms)
+    import avatar
+    avatar.warmup()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    print(f"embed latency {args.embed_latency_ms} ms, llm latency {args.llm_latency_ms} ms, "
+          f"{args.requests} requests x {args.concurrency} workers")
+    header = (f"{'docs':>7} {'index s':>8} {'index MB':>9} {'retr p50':>9} {'retr p95':>9} "
+              f"{'ask p50':>9} {'ask p95':>9} {'req/s':>8} {'errors':>6} {'peak RSS MB':>12}")
+    print(header)
+    print("-" * len(header))
+
+    for size in sizes:
+        corpus = synthetic_corpus(size, seed=args.seed)
+        # Indexing is measured without simulated latency so the column reflects
+        # local cost only; a real deployment pays one embedding call per document.
+        avatar.get_embedding_client().latency_ms = 0.0
+        start = time.perf_counter()
+        avatar.index_documents(corpus)
+        index_seconds = time.perf_counter() - start
+        # tracemalloc slows every allocation, so memory gets its own pass
+        tracemalloc.start()
+        avatar.index_documents(corpus)
+        _, index_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        avatar.get_embedding_client().latency_ms = args.embed_latency_ms
+
+        retrieval = time_retrieval(avatar, args.retrieval_iterations)
+        latencies, errors, elapsed = run_load(avatar, args.requests, args.concurrency)
+
+        print(f"{size:>7} {index_seconds:>8.2f} {index_peak / (1024 * 1024):>9.1f} "
+              f"{statistics.median(retrieval):>9.2f} {percentile(retrieval, 95):>9.2f} "
+              f"{statistics.median(latencies):>9.2f} {percentile(latencies, 95):>9.2f} "
+              f"{len(latencies) / elapsed:>8.1f} {errors:>6} {max_rss_mb():>12.1f}")
+
+    print("retrieval and /ask latencies in ms; index MB is peak traced allocation while indexing; "
+          "peak RSS MB is the process high-water mark so far, not per size")
+
+
+if __name__ == "__main__":
+    main()
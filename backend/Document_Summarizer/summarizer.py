@@ -1,13 +1,10 @@
 import json
 import os
 import tempfile
+import threading
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import firebase_admin
-from firebase_admin import credentials, firestore, initialize_app
 import requests
-from PyPDF2 import PdfReader
-import docx
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,6 +18,10 @@ AZURE_API_VERSION = os.environ.get("AZURE_OPENAI_VERSION", "2023-05-15")
 if not (AZURE_ENDPOINT and AZURE_API_KEY and AZURE_DEPLOYMENT):
     raise RuntimeError("Please set AZURE_OPENAI_ENDPOINT, AZURE_OPENAI_API_KEY and AZURE_DEPLOYMENT_NAME in your .env")
 
+# Firebase and the PDF/DOCX parsers are loaded on first use. Unless
+# SUMMARIZER_WARMUP=0, they are also loaded in a background thread at startup.
+WARMUP_ON_STARTUP = os.getenv("SUMMARIZER_WARMUP", "1") != "0"
+
 # --- Flask + CORS ---
 app = Flask(__name__)
 # allow all origins (change to specific origins in production)
@@ -41,19 +42,32 @@ firebase_config = {
     "universe_domain": "googleapis.com"
 }
 
-try:
-    if not firebase_admin._apps:
-        cred = credentials.Certificate(firebase_config)
-        initialize_app(cred)
-    db = firestore.client()
-except Exception as e:
-    # If firebase fails to init, keep db = None and surface meaningful errors later
-    print("Firebase init error:", e)
-    db = None
+_firebase_lock = threading.Lock()
+_firestore_client = None
+
+def get_firestore_client():
+    global _firestore_client
+    if _firestore_client is not None:
+        return _firestore_client
+    with _firebase_lock:
+        if _firestore_client is None:
+            try:
+                import firebase_admin
+                from firebase_admin import credentials, firestore, initialize_app
+                if not firebase_admin._apps:
+                    cred = credentials.Certificate(firebase_config)
+                    initialize_app(cred)
+                _firestore_client = firestore.client()
+            except Exception as e:
+                # Only a successful client is kept, so the next call retries;
+                # callers get None and surface meaningful errors
+                print("Firebase init error:", e)
+        return _firestore_client
 
 # --- Text extraction functions (PDF/DOCX/TXT) ---
 def extract_text_from_pdf(url):
     try:
+        from PyPDF2 import PdfReader
         response = requests.get(url, timeout=30)
         response.raise_for_status()
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
@@ -73,6 +87,7 @@ def extract_text_from_pdf(url):
 
 def extract_text_from_docx(url):
     try:
+        import docx
         response = requests.get(url, timeout=30)
         response.raise_for_status()
         with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as temp_file:
@@ -259,6 +274,7 @@ def match_skills():
     if not project_desc:
         return jsonify({"error": "projectDescription required"}), 400
 
+    db = get_firestore_client()
     if db is None:
         return jsonify({"error": "Firestore not initialized"}), 500
 
@@ -332,6 +348,18 @@ Top 3 only. Score >= 0.50.
         print("LLM or parse error:", e)
         return jsonify({"error": "Failed to process skill matching"}), 500
 
+# --- Startup warmup ---
+def warmup():
+    get_firestore_client()
+    try:
+        import PyPDF2  # noqa: F401
+        import docx  # noqa: F401
+    except Exception as e:
+        print("Parser warmup error:", e)
+
+if WARMUP_ON_STARTUP:
+    threading.Thread(target=warmup, name="summarizer-warmup", daemon=True).start()
+
 # --- Health endpoint ---
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -0,0 +1,97 @@
+"""
+Import-time profile for the backend services.
+
+Imports each service module in a fresh interpreter with ``python -X importtime``
+(startup warmup disabled) and reports total import wall time plus the slowest
+top-level imports, so cold-start regressions show up before deployment.
+
+Usage:
+    python import_profile.py [--top 10] [service ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# service name -> (working directory, module)
+SERVICES = {
+    "avatar": (os.path.join(BACKEND_DIR, "Avatar_LLM_Endpoint"), "avatar"),
+    "summarizer": (os.path.join(BACKEND_DIR, "Document_Summarizer"), "summarizer"),
+    "tools": (BACKEND_DIR, "tools"),
+    "agent": (BACKEND_DIR, "agent"),
+}
+
+
+def parse_importtime(stderr):
+    """Return [(cumulative_us, depth, module)] parsed from -X importtime output."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2][1:]
+        # Nested imports are indented two spaces per level under their parent
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        entries.append((int(fields[1]), depth, name.strip()))
+    return entries
+
+
+def profile_service(name, top):
+    cwd, module = SERVICES[name]
+    env = dict(os.environ, AVATAR_WARMUP="0", SUMMARIZER_WARMUP="0")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    entries = parse_importtime(proc.stderr)
+    # The service module is imported last at depth 0; its direct imports
+    # are the depth-1 entries logged just before it.
+    total_us, children = 0, []
+    for index in range(len(entries) - 1, -1, -1):
+        cumulative_us, depth, module_name = entries[index]
+        if depth == 0 and module_name == module:
+            total_us = cumulative_us
+            for child in reversed(entries[:index]):
+                if child[1] == 0:
+                    break
+                if child[1] == 1:
+                    children.append((child[0], child[2]))
+            break
+
+    print(f"== {name} ({module}.py) ==")
+    if proc.returncode != 0:
+        error = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        print(f"  import failed: {error[-1] if error else 'exit code ' + str(proc.returncode)}")
+        print("  no timings reported: the import did not complete")
+        print()
+        return
+    print(f"  process wall time: {wall * 1000:.0f} ms")
+    print(f"  {module} import time: {total_us / 1000:.0f} ms")
+    for cumulative_us, module_name in sorted(children, reverse=True)[:top]:
+        print(f"  {cumulative_us / 1000:>9.1f} ms  {module_name}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("services", nargs="*",
+                        help=f"services to profile: {', '.join(SERVICES)} (default: all)")
+    parser.add_argument("--top", type=int, default=10,
+                        help="number of slowest imports to list per service")
+    args = parser.parse_args()
+    unknown = [name for name in args.services if name not in SERVICES]
+    if unknown:
+        parser.error(f"unknown service(s): {', '.join(unknown)}")
+    for name in args.services or SERVICES:
+        profile_service(name, args.top)
+
+
+if __name__ == "__main__":
+    main()
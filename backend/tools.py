@@ -1,8 +1,8 @@
 import logging
 from livekit.agents import function_tool, RunContext
 import requests
-from langchain_community.tools import DuckDuckGoSearchRun
 import os
+from functools import lru_cache
 import smtplib
 from email.mime.multipart import MIMEMultipart  
 from email.mime.text import MIMEText
@@ -28,6 +28,12 @@ async def get_weather(
         logging.error(f"Error retrieving weather for {city}: {e}")
         return f"An error occurred while retrieving weather for {city}." 
 
+@lru_cache(maxsize=None)
+def get_search_tool():
+    # langchain_community is slow to import, so load it on the first search
+    from langchain_community.tools import DuckDuckGoSearchRun
+    return DuckDuckGoSearchRun()
+
 @function_tool()
 async def search_web(
     context: RunContext,  # type: ignore
@@ -36,7 +42,7 @@ async def search_web(
     Search the web using DuckDuckGo.
     """
     try:
-        results = DuckDuckGoSearchRun().run(tool_input=query)
+        results = get_search_tool().run(tool_input=query)
         logging.info(f"Search results for '{query}': {results}")
         return results
     except Exception as e: